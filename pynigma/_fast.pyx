@@ -0,0 +1,21 @@
+# cython: language_level=3
+'''Compiled URL assembly for the request hot path.
+
+This module is an optional, ahead-of-time compiled twin of the pure
+Python URL builder in :mod:`pynigma.client`. It is built only when
+Cython is available at install time; the client falls back to the
+Python implementation when the extension is missing.
+'''
+
+from urllib.parse import urlencode
+
+
+cpdef str build_url(str prefix, datapath, tuple params):
+    cdef str url
+    # There is no datapath associated with the limits endpoint.
+    if not datapath:
+        return prefix
+    url = prefix + '/' + <str>datapath
+    if params:
+        url = url + '?' + urlencode(params)
+    return url
@@ -0,0 +1,151 @@
+'''This module provides an asyncio client for the `Engima API`_.
+
+.. _Engima API: https://app.enigma.io/api
+
+The synchronous :class:`pynigma.client.EnigmaAPI` blocks on one TCP
+round trip per call. :class:`AsyncEnigmaAPI` issues requests through a
+shared ``aiohttp`` connector pool so independent calls — pages of a
+table, metadata joined with data and stats — overlap their network
+latency instead of paying for it in sequence.
+
+This module requires the ``aiohttp`` package, available through the
+``async`` extra:
+
+.. code-block:: bash
+
+   pip install pynigma[async]
+
+Example:
+
+.. code-block:: python
+
+   >>> async with aio.AsyncEnigmaAPI(ENIGMA_API_KEY) as api:
+   ...     pages = await api.gather_pages(
+   ...         datapath='us.gov.whitehouse.visitor-list', pages=range(1, 5))
+'''
+
+import asyncio
+import warnings
+
+try:
+    import aiohttp
+except ImportError:
+    raise ImportError(
+        'pynigma.aio requires the aiohttp package. '
+        "Install it with pip install 'pynigma[async]'.")
+
+from .client import EnigmaAPI, _loads, _map_metadata_data_type
+
+
+class AsyncEnigmaAPI(EnigmaAPI):
+    '''This class provides coroutine access to Enigma API endpoints.
+
+    Each endpoint has a coroutine counterpart to the synchronous
+    methods of :class:`pynigma.client.EnigmaAPI`:
+
+        * :meth:`aget_data`
+        * :meth:`aget_metadata`
+        * :meth:`aget_stats`
+        * :meth:`aget_export`
+        * :meth:`aget_limits`
+
+    Query parameters are accepted by each endpoint method as
+    `**kwargs`, exactly as for the synchronous client.
+
+    Parameters
+    ----------
+    client_key : str
+        API key
+    connector_limit : int
+        Maximum number of pooled connections (default 20)
+
+    Returns
+    -------
+    :class:`AsyncEnigmaAPI`
+    '''
+    __slots__ = ('_connector_limit', '_aio_session')
+
+    def __init__(self, client_key, connector_limit=20):
+        super(AsyncEnigmaAPI, self).__init__(client_key)
+        # The pooled requests.Session the base class sets up is unused
+        # here; all traffic goes through the aiohttp session instead.
+        self._session.close()
+        self._connector_limit = connector_limit
+        self._aio_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        '''Close the underlying aiohttp session and its connector.'''
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+
+    def _aio(self):
+        # The session is created lazily so it binds to the running
+        # event loop rather than whichever loop exists at __init__.
+        if self._aio_session is None:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connector_limit),
+                headers={'Accept-Encoding': 'gzip'})
+        return self._aio_session
+
+    async def _arequest(self, resource, datapath, params):
+        self.request_url = self._url_for_datapath(resource, datapath, params)
+        async with self._aio().get(self.request_url) as res:
+            if res.status != 200:
+                warnings.warn(
+                    'Request returned with status code: {0}.'.format(
+                        res.status))
+                return None
+            return _loads(await res.read())
+
+    async def aget_data(self, datapath, **kwargs):
+        '''Coroutine counterpart of :meth:`EnigmaAPI.get_data`.'''
+        return await self._arequest('data', datapath, kwargs)
+
+    async def aget_metadata(self, datapath, **kwargs):
+        '''Coroutine counterpart of :meth:`EnigmaAPI.get_metadata`.'''
+        metadata_res = await self._arequest('meta', datapath, kwargs)
+        # _arequest warns and returns None for non-200 responses.
+        if metadata_res is None:
+            return None
+        metadata_res['result']['columns'] = _map_metadata_data_type(
+            metadata_res['result']['columns'])
+        return metadata_res
+
+    async def aget_stats(self, datapath, **kwargs):
+        '''Coroutine counterpart of :meth:`EnigmaAPI.get_stats`.'''
+        return await self._arequest('stats', datapath, kwargs)
+
+    async def aget_export(self, datapath, **kwargs):
+        '''Coroutine counterpart of :meth:`EnigmaAPI.get_export`.'''
+        return await self._arequest('export', datapath, kwargs)
+
+    async def aget_limits(self):
+        '''Coroutine counterpart of :meth:`EnigmaAPI.get_limits`.'''
+        return await self._arequest('limits', None, {})
+
+    async def gather_pages(self, datapath, pages, **kwargs):
+        '''Fetch several pages of a data table concurrently.
+
+        Parameters
+        ----------
+        datapath : str
+        pages : iterable of int
+            Page numbers to request
+        **kwargs : collections.Mapping
+            Optional query parameters applied to every page
+
+        Returns
+        -------
+        list of json
+            One parsed response per requested page, in page order
+        '''
+        return await asyncio.gather(*[
+            self.aget_data(datapath, page=str(page), **kwargs)
+            for page in pages])
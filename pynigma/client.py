@@ -16,43 +16,126 @@ Example:
 '''
 
 import decimal
+import functools
 import requests
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from urllib.parse import urlencode
+
+# orjson decodes the dict-heavy Enigma responses several times faster
+# than the standard library; fall back to stdlib json when it isn't
+# installed (it ships with the pynigma[fast] extra).
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    from json import loads as _loads
+
+# pysimdjson parses multi-MB responses faster still by scanning for
+# structural characters with SIMD instructions. A single module-level
+# parser is kept so its internal buffers are reused across requests.
+# The parsed document is materialized eagerly because callers mutate
+# the response (get_metadata stamps python_type onto each column), and
+# because a parse invalidates the previous proxy, parse and
+# materialize happen under a lock — iter_data's prefetch thread and
+# the caller's thread may both be parsing at once.
+try:
+    import simdjson
+    _SIMD_PARSER = simdjson.Parser()
+    _SIMD_LOCK = threading.Lock()
+
+    def _parse_response(content):
+        with _SIMD_LOCK:
+            parsed = _SIMD_PARSER.parse(content)
+            if isinstance(parsed, simdjson.Object):
+                return parsed.as_dict()
+            if isinstance(parsed, simdjson.Array):
+                return parsed.as_list()
+            return parsed
+except ImportError:
+    _SIMD_PARSER = None
+    _SIMD_LOCK = None
+    _parse_response = _loads
+
+# Brotli is only advertised when a decoder is installed (the 'fast'
+# extra): setting Accept-Encoding manually overrides urllib3's own
+# negotiation, and a brotli body it can't inflate would reach the JSON
+# parser still compressed.
+try:
+    import brotli
+    _ACCEPT_ENCODING = 'gzip, br'
+except ImportError:
+    try:
+        import brotlicffi
+        _ACCEPT_ENCODING = 'gzip, br'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip'
 
 API_ENDPOINT = 'https://api.enigma.io'
 API_VERSION = 'v2'
+REQUEST_TIMEOUT = 30
+
+
+# Data type mappings are based on PL/Python
+# PostgreSQL to Python mappings:
+#     http://www.postgresql.org/docs/9.4/static/plpython-data.html
+_DATA_TYPE_CODEC = {
+    'bigint': int,
+    'boolean': bool,
+    'bytea': str,
+    'character varying': str,
+    'date': date,
+    'double': float,
+    'double precision': float,
+    'int': int,
+    'integer': int,
+    'numeric': decimal.Decimal,
+    'oid': int,
+    'real': float,
+    'smallint': int,
+    'text': str,
+    'timestamp without time zone': datetime,
+    'timestamp': datetime,
+    'varcahr': str
+}
+
+
+def _py_build_url(prefix, datapath, params):
+    # There is no datapath associated with the limits endpoint.
+    if not datapath:
+        return prefix
+    url = '{0}/{1}'.format(prefix, datapath)
+    # urlencode percent-encodes parameter values, so callers no longer
+    # need to quote search strings themselves.
+    if params:
+        url = '{0}?{1}'.format(url, urlencode(params))
+    return url
+
+
+# Prefer the Cython-compiled builder when the optional _fast extension
+# was built; it skips bytecode dispatch for this small, hot function.
+try:
+    from ._fast import build_url as _build_url
+except ImportError:
+    _build_url = _py_build_url
+
+
+def _make_param_validator(allowed):
+    # Closure specialization: the allowed frozenset is baked into a
+    # cell variable, so each call is a single set subtraction.
+    def validator(params):
+        return params.keys() - allowed
+    return validator
 
 
 def _map_metadata_data_type(metadata_columns):
-    # Data type mappings are based on PL/Python
-    # PostgreSQL to Python mappings:
-    #     http://www.postgresql.org/docs/9.4/static/plpython-data.html
-    data_type_codec = {
-        'bigint': int,
-        'boolean': bool,
-        'bytea': str,
-        'character varying': str,
-        'date': date,
-        'double': float,
-        'double precision': float,
-        'int': int,
-        'integer': int,
-        'numeric': decimal.Decimal,
-        'oid': int,
-        'real': float,
-        'smallint': int,
-        'text': str,
-        'timestamp without time zone': datetime,
-        'timestamp': datetime,
-        'varcahr': str
-    }
-
     for column in metadata_columns:
         # Data types returned by the MetaData endpoint
         # are prefixed with type_
-        column['python_type'] = data_type_codec.get(
-                ' '.join(column['type'].split('_')[1:]), str)
+        data_type = column['type'].removeprefix('type_').replace('_', ' ')
+        column['python_type'] = _DATA_TYPE_CODEC.get(data_type, str)
     return metadata_columns
 
 
@@ -100,56 +183,117 @@ class EnigmaAPI(object):
     -------
     :class:`EnigmaAPI`
     '''
+    # __slots__ drops the per-instance __dict__, shrinking instances
+    # and turning attribute access into a fixed-offset load.
+    __slots__ = ('client_key', '_endpoint', '_version', '_session',
+                 'request_url', '_repr', '_prefixes', '_limits_url')
+
+    # frozensets so parameter validation can subtract against a
+    # prebuilt hashed structure instead of rebuilding a set per call.
     _param_mapping = {
-        'meta': ['page'],
-        'data': ['limit', 'select', 'search',
-                 'where', 'conjunction', 'sort', 'page'],
-        'stats': ['select', 'operation', 'by', 'of', 'limit',
-                  'search', 'where', 'conjunction', 'sort', 'page'],
-        'export': ['select', 'search', 'where', 'conjunction', 'sort'],
-        'limits': []
+        'meta': frozenset(['page']),
+        'data': frozenset(['limit', 'select', 'search',
+                           'where', 'conjunction', 'sort', 'page']),
+        'stats': frozenset(['select', 'operation', 'by', 'of', 'limit',
+                            'search', 'where', 'conjunction', 'sort',
+                            'page']),
+        'export': frozenset(['select', 'search', 'where', 'conjunction',
+                             'sort']),
+        'limits': frozenset()
     }
+    # One specialized validator per resource, built once at
+    # class-definition time.
+    _validators = {resource: _make_param_validator(allowed)
+                   for resource, allowed in _param_mapping.items()}
 
     def __init__(self, client_key):
         self.client_key = client_key
         self._endpoint = API_ENDPOINT
         self._version = API_VERSION
 
+        # A single Session reuses TCP+TLS connections across requests
+        # via urllib3's connection pool, rather than paying for a new
+        # handshake on every call.
+        self._session = requests.Session()
+        # Compressed bodies are 5-10x smaller on the wire and urllib3
+        # inflates them in C.
+        self._session.headers.update({
+            'Accept-Encoding': _ACCEPT_ENCODING,
+            'Connection': 'keep-alive'
+        })
+
         self.request_url = None
 
+        # Per-resource URL prefixes: the endpoint, version, and key
+        # never change per instance, so these joins happen once.
+        self._prefixes = {
+            resource: '{0}/{1}/{2}/{3}'.format(
+                self._endpoint, self._version, resource, client_key)
+            for resource in self._param_mapping}
+        # The limits endpoint takes no datapath and no parameters, so
+        # its URL is fully known at construction time.
+        self._limits_url = self._prefixes['limits']
+
+        # The endpoint and version never change per instance, so the
+        # repr string is rendered once here rather than on every call.
+        self._repr = '{0}(endpoint={1}, version={2})'.format(
+            type(self).__name__, self._endpoint, self._version)
+
     def __repr__(self):
-        return 'EnigmaAPI(endpoint={endpoint}, version={version})'.format(
-            endpoint=self._endpoint, version=self._version)
+        return self._repr
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        '''Close the underlying HTTP session and its pooled connections.'''
+        self._session.close()
 
-    def _check_query_params(self, resource, **kwargs):
-        invalid_params = set(
-            kwargs.keys()) - set(self._param_mapping[resource])
+    def _check_query_params(self, resource, params):
+        invalid_params = self._validators[resource](params)
         if invalid_params:
             raise ValueError(
                 'Invalid parameters for the {0} endpoint passed: {1}'.format(
                     resource, invalid_params))
         return True
 
-    def _url_for_datapath(self, resource, datapath, **kwargs):
-        if self._check_query_params(resource=resource, **kwargs):
-            base_url = '/'.join(
-                [self._endpoint, self._version, resource, self.client_key])
-            # There is no datapath associated with the limits endpoint.
-            if datapath:
-                params = ['='.join([k, v]) for k, v in kwargs.items()]
-                return '/'.join([base_url, datapath, '?' + '&'.join(params)])
-            return base_url
-
-    def _request(self, resource, datapath, **kwargs):
-        self.request_url = self._url_for_datapath(
-            resource, datapath, **kwargs)
+    # Memoized on its (hashable) argument tuple: repeated calls for the
+    # same resource, datapath, and parameters — pagination loops,
+    # dashboards — collapse into a cache lookup.
+    _build_url = staticmethod(functools.lru_cache(maxsize=256)(_build_url))
+
+    def _url_for_datapath(self, resource, datapath, params):
+        if self._check_query_params(resource, params):
+            return self._build_url(
+                self._prefixes[resource], datapath,
+                tuple(sorted(params.items())))
+
+    def _fetch(self, url):
+        # Stream the response and return the raw body instead of
+        # letting requests buffer it into res.content first, which
+        # would touch every byte twice.
+        res = self._session.get(url, stream=True, timeout=REQUEST_TIMEOUT)
         try:
-            res = requests.get(self.request_url)
-        except res.status_code != 200:
-            warnings.warn('Request returned with status code: {0}.'.format(
-                res.status_code))
+            # Failing fast on a non-200 skips the pointless JSON decode
+            # of an error body.
+            if res.status_code != 200:
+                warnings.warn(
+                    'Request returned with status code: {0}.'.format(
+                        res.status_code))
+                return None
+            return res.raw.read(decode_content=True)
         finally:
-            return res.json()
+            res.close()
+
+    def _request(self, resource, datapath, params):
+        self.request_url = self._url_for_datapath(resource, datapath, params)
+        data = self._fetch(self.request_url)
+        if data is None:
+            return None
+        return _parse_response(data)
 
     def get_data(self, datapath, **kwargs):
         '''Request data from the `data endpoint`_.
@@ -184,7 +328,58 @@ class EnigmaAPI(object):
         ValueError
             if an invalid ``datapath`` is provided
         '''
-        return self._request(resource='data', datapath=datapath, **kwargs)
+        return self._request('data', datapath, kwargs)
+
+    def iter_data(self, datapath, **kwargs):
+        '''Iterate over pages from the `data endpoint`_.
+
+        .. _data endpoint: https://app.enigma.io/api#data
+
+        Pages are requested one ahead of the caller on a background
+        thread, so the network round trip for page N+1 overlaps with
+        the processing of page N. The ``page`` query parameter is
+        managed by the generator and must not be passed.
+
+        Example:
+
+        .. code-block:: python
+
+           >>> for page in api.iter_data(datapath='us.gov.whitehouse.visitor-list'):
+           ...     process(page['result'])
+
+        Parameters
+        ----------
+        datapath : str
+        **kwargs : collections.Mapping
+            Optional query parameters applied to every page
+
+        Yields
+        ------
+        json
+            One parsed response per page
+
+        Raises
+        ------
+        ValueError
+            if an invalid ``datapath`` is provided
+        '''
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            future = executor.submit(
+                self.get_data, datapath, page=str(page), **kwargs)
+            while True:
+                response = future.result()
+                has_next = bool(response) and bool(
+                    response.get('info', {}).get('next_page'))
+                # Submit the next page before yielding so it downloads
+                # while the caller consumes the current one.
+                if has_next:
+                    page += 1
+                    future = executor.submit(
+                        self.get_data, datapath, page=str(page), **kwargs)
+                yield response
+                if not has_next:
+                    break
 
     def get_metadata(self, datapath, **kwargs):
         '''Request data from the `metadata endpoint`_.
@@ -223,8 +418,10 @@ class EnigmaAPI(object):
         -------
         json
         '''
-        metadata_res = self._request(
-            resource='meta', datapath=datapath, **kwargs)
+        metadata_res = self._request('meta', datapath, kwargs)
+        # _request warns and returns None for non-200 responses.
+        if metadata_res is None:
+            return None
         metadata_res['result']['columns'] = _map_metadata_data_type(
             metadata_res['result']['columns'])
         return metadata_res
@@ -266,7 +463,7 @@ class EnigmaAPI(object):
         ValueError
             if an invalid ``datapath`` is provided
         '''
-        return self._request(resource='stats', datapath=datapath, **kwargs)
+        return self._request('stats', datapath, kwargs)
 
     def get_export(self, datapath, **kwargs):
         '''Request data from the `export endpoint`_.
@@ -299,7 +496,48 @@ class EnigmaAPI(object):
         ValueError
             if an invalid ``datapath`` is provided
         '''
-        return self._request(resource='export', datapath=datapath, **kwargs)
+        return self._request('export', datapath, kwargs)
+
+    def get_export_url(self, datapath, **kwargs):
+        '''Request only the export file URL from the `export endpoint`_.
+
+        .. _export endpoint: https://app.enigma.io/export
+
+        Unlike :meth:`get_export`, which parses the whole response,
+        this extracts the head_url field with a simdjson pointer lookup
+        when simdjson is available, skipping materialization of the
+        rest of the document.
+
+        Example:
+
+        .. code-block:: python
+
+           >>> api.get_export_url(datapath='us.gov.whitehouse.visitor-list')
+           https://enigma-api-export...
+
+        Parameters
+        ----------
+        datapath : str
+        **kwargs : collections.Mapping
+            Optional query parameters
+
+        Returns
+        -------
+        str, or None if the request failed
+
+        Raises
+        ------
+        ValueError
+            if an invalid ``datapath`` is provided
+        '''
+        self.request_url = self._url_for_datapath('export', datapath, kwargs)
+        data = self._fetch(self.request_url)
+        if data is None:
+            return None
+        if _SIMD_PARSER is not None:
+            with _SIMD_LOCK:
+                return _SIMD_PARSER.parse(data).at_pointer('/head_url')
+        return _loads(data)['head_url']
 
     def get_limits(self):
         '''Request data from the `limits endpoint`_.
@@ -320,10 +558,11 @@ class EnigmaAPI(object):
         Returns
         -------
         json
-
-        Raises
-        ------
-        ValueError
-            if an invalid ``datapath`` is provided
         '''
-        return self._request(resource='limits', datapath=None)
+        # The URL is precomputed in __init__; there are no parameters
+        # to validate and nothing to assemble per call.
+        self.request_url = self._limits_url
+        data = self._fetch(self._limits_url)
+        if data is None:
+            return None
+        return _parse_response(data)
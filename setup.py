@@ -4,12 +4,21 @@ import versioneer
 
 _version = versioneer.get_version()
 
+# The _fast extension is a compiled twin of the pure Python URL
+# builder; it is only built when Cython is available.
+try:
+    from Cython.Build import cythonize
+    _ext_modules = cythonize(['pynigma/_fast.pyx'])
+except ImportError:
+    _ext_modules = []
+
 
 setup(
     name='pynigma',
     description='A Python client for the Enigma API.',
     version=_version,
     cmdclass=versioneer.get_cmdclass(),
+    ext_modules=_ext_modules,
     packages=[
         'pynigma'
     ],
@@ -22,6 +31,20 @@ setup(
     install_requires=[
         'requests'
     ],
+    extras_require={
+        'async': [
+            'aiohttp'
+        ],
+        'fast': [
+            'brotli',
+            'orjson'
+        ],
+        'tests': [
+            'pytest',
+            'pytest-xdist',
+            'vcrpy'
+        ]
+    },
     author='Jane Stewart Adams',
     author_email='jane@thejunglejane.com',
     license='MIT',
@@ -0,0 +1,109 @@
+import random
+import string
+import unittest
+from unittest import mock
+
+try:
+    from pynigma import aio
+except ImportError:
+    aio = None
+
+SALARIES = 'us.gov.whitehouse.salaries.2011'
+VISITORS = 'us.gov.whitehouse.visitor-list'
+
+
+def _patch_arequest():
+    # Patched as a context manager rather than a decorator so
+    # aio.AsyncEnigmaAPI is only resolved when the tests actually run
+    # (the class is skipped when aiohttp is missing).
+    return mock.patch.object(aio.AsyncEnigmaAPI, '_arequest', autospec=True)
+
+
+@unittest.skipUnless(aio, 'aiohttp is not installed')
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.new_client = aio.AsyncEnigmaAPI(
+            ''.join(random.choice(string.ascii_lowercase) for _ in range(32)))
+
+    async def test_aget_data(self):
+        '''Does aget_data() call _arequest with resource='data'?'''
+        with _patch_arequest() as mock_method:
+            await self.new_client.aget_data(datapath=SALARIES)
+            mock_method.assert_called_with(
+                self.new_client, 'data', SALARIES, {})
+
+    async def test_aget_stats(self):
+        '''Does aget_stats() call _arequest with resource='stats'?'''
+        with _patch_arequest() as mock_method:
+            await self.new_client.aget_stats(datapath=SALARIES)
+            mock_method.assert_called_with(
+                self.new_client, 'stats', SALARIES, {})
+
+    async def test_aget_export(self):
+        '''Does aget_export() call _arequest with resource='export'?'''
+        with _patch_arequest() as mock_method:
+            await self.new_client.aget_export(datapath=SALARIES)
+            mock_method.assert_called_with(
+                self.new_client, 'export', SALARIES, {})
+
+    async def test_aget_limits(self):
+        '''Does aget_limits() call _arequest with resource='limits'?'''
+        with _patch_arequest() as mock_method:
+            await self.new_client.aget_limits()
+            mock_method.assert_called_with(self.new_client, 'limits', None, {})
+
+    async def test_aget_metadata(self):
+        '''Does aget_metadata() call _arequest with resource='meta' and
+        stamp python_type onto every column?
+        '''
+        with _patch_arequest() as mock_method:
+            mock_method.return_value = {
+                'result': {
+                    'columns': [{'id': 'test', 'type': 'type_numeric'}]}}
+            metadata = await self.new_client.aget_metadata(datapath=VISITORS)
+            mock_method.assert_called_with(
+                self.new_client, 'meta', VISITORS, {})
+        for column in metadata['result']['columns']:
+            self.assertIn('python_type', column)
+
+    async def test_aget_metadata_non_200(self):
+        '''Does aget_metadata() return None when the request failed?'''
+        with _patch_arequest() as mock_method:
+            mock_method.return_value = None
+            self.assertIsNone(
+                await self.new_client.aget_metadata(datapath=VISITORS))
+
+    async def test_arequest_invalid_params(self):
+        '''Does _arequest() raise a ValueError when invalid parameters
+        are passed?
+        '''
+        with self.assertRaises(ValueError):
+            await self.new_client._arequest(
+                'stats', SALARIES, {'invalid': ''})
+
+    async def test_arequest_non_200(self):
+        '''Does _arequest() warn and return None for a non-200 status?'''
+        response = mock.MagicMock()
+        response.status = 500
+        context = mock.MagicMock()
+        context.__aenter__ = mock.AsyncMock(return_value=response)
+        context.__aexit__ = mock.AsyncMock(return_value=False)
+        with mock.patch.object(aio.AsyncEnigmaAPI, '_aio') as mock_aio:
+            mock_aio.return_value.get.return_value = context
+            with self.assertWarns(UserWarning):
+                self.assertIsNone(
+                    await self.new_client._arequest('data', SALARIES, {}))
+
+    async def test_gather_pages(self):
+        '''Does gather_pages() return one response per page, in page
+        order?
+        '''
+        with mock.patch.object(
+                aio.AsyncEnigmaAPI, 'aget_data', autospec=True) as mock_method:
+            mock_method.side_effect = (
+                lambda client_obj, datapath, **kwargs:
+                    {'page': kwargs['page']})
+            pages = await self.new_client.gather_pages(SALARIES, range(1, 4))
+        self.assertEqual([page['page'] for page in pages], ['1', '2', '3'])
@@ -1,94 +1,160 @@
-import decimal
+import os
 import random
+import requests
 import string
 import unittest
 from unittest import mock
 
 from pynigma import client
 
+# Datapaths shared across tests; single definitions keep cassette and
+# cache keys identical everywhere and leave no room for typos.
+SALARIES = 'us.gov.whitehouse.salaries.2011'
+VISITORS = 'us.gov.whitehouse.visitor-list'
 
-class TestClient(unittest.TestCase):
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
 
-    def setUp(self):
-        self.new_client = client.EnigmaAPI(
-            ''.join(random.choice(string.ascii_lowercase) for _ in range(32)))
 
-    def tearDown(self):
-        del self.new_client
+def _load_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), 'rb') as f:
+        return f.read()
 
-    def test_check_query_params_valid_param(self):
-        '''Does _check_query_params() return True for a valid parameter?'''
-        self.assertTrue(
-            self.new_client._check_query_params(
-                resource='data', **{'search': ''}))
 
-    def test_check_query_params_valid_params(self):
-        '''Does _check_query_params() return True for valid parameters?'''
-        self.assertTrue(
-            self.new_client._check_query_params(
-                resource='data', **{'search': '', 'limit': ''}))
+# Canned response bodies, loaded once at import so no test touches the
+# network.
+DATA_FIXTURE = _load_fixture('data.json')
+META_FIXTURE = _load_fixture('meta.json')
 
-    def test_check_query_params_invalid_param(self):
-        '''Does _check_query_params() raise a ValueError for an invalid
-        parameter?
-        '''
-        with self.assertRaises(ValueError):
-            self.new_client._check_query_params(
-                resource='meta', **{'limit': ''})
 
-    def test_check_query_params_invalid_params(self):
-        '''Does _check_query_params() raise a ValueError for invalid
-        parameters?
-        '''
-        with self.assertRaises(ValueError):
-            self.new_client._check_query_params(
-                resource='meta', **{'where': '', 'conjunction': ''})
+def _mock_response(body, status_code=200):
+    response = mock.Mock()
+    response.status_code = status_code
+    response.raw.read.return_value = body
+    return response
 
-    def test_check_query_params_no_params(self):
-        '''Does _check_query_params() return True when no parameters
-        are passed?
+
+class TestClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # The client is stateless across tests, so one instance (and
+        # its pooled session) is shared by the whole class instead of
+        # being rebuilt per test.
+        cls.new_client = client.EnigmaAPI(
+            ''.join(random.choice(string.ascii_lowercase) for _ in range(32)))
+        # One Session.get patcher serves every HTTP test for the whole
+        # class; individual tests only point it at the right canned
+        # body instead of registering their own mock.
+        # Not autospec'd: an autospec'd function stored on the test
+        # class would be bound like a method on self.mock_get access.
+        cls._get_patcher = mock.patch.object(requests.Session, 'get')
+        cls.mock_get = cls._get_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._get_patcher.stop()
+        cls.new_client.close()
+
+    def setUp(self):
+        # Only call history is cleared between tests; each HTTP test
+        # sets its own return value.
+        self.mock_get.reset_mock()
+
+    def test_session_pooling(self):
+        '''Does the client keep one pooled session for all requests?'''
+        self.assertIsInstance(self.new_client._session, requests.Session)
+        self.assertEqual(
+            self.new_client._session.headers['Connection'], 'keep-alive')
+
+    def test_check_query_params(self):
+        '''Does _check_query_params() return True for valid parameters
+        and raise a ValueError for invalid ones?
         '''
-        self.assertTrue(self.new_client._check_query_params(resource='stats'))
+        cases = [
+            ('data', {'search': ''}, True),
+            ('data', {'search': '', 'limit': ''}, True),
+            ('stats', {}, True),
+            ('meta', {'limit': ''}, ValueError),
+            ('meta', {'where': '', 'conjunction': ''}, ValueError)
+        ]
+        for resource, params, expected in cases:
+            with self.subTest(resource=resource, params=params):
+                if expected is ValueError:
+                    with self.assertRaises(ValueError):
+                        self.new_client._check_query_params(resource, params)
+                else:
+                    self.assertTrue(
+                        self.new_client._check_query_params(resource, params))
 
     def test_url_for_datapath_no_params(self):
         '''Does _url_for_datapath() return a string when no parameters
         are passed?
         '''
         self.assertIsInstance(self.new_client._url_for_datapath(
-            resource='stats', datapath='us.gov.whitehouse.salaries.2011'), str)
+            'stats', SALARIES, {}), str)
 
     def test_url_for_datapath_valid_params(self):
         '''Does _url_for_datapath() return a string when valid
         parameters are passed?
         '''
         self.assertIsInstance(self.new_client._url_for_datapath(
-            resource='stats',
-            datapath='us.gov.whitehouse.salaries.2011',
-            **{'operation': ''}), str)
+            'stats', SALARIES, {'operation': ''}), str)
 
     def test_request_invalid_params(self):
         '''Does _request() raise a ValueError when invalid parameters
         are passed, and NOT set the attribute request_url?
         '''
+        url_before = self.new_client.request_url
         with self.assertRaises(ValueError):
-            self.new_client._request(resource='stats',
-                                     datapath='us.gov.whitehouse.salaries.2011',
-                                     **{'invalid': ''})
-        self.assertIsNone(self.new_client.request_url)
+            self.new_client._request('stats', SALARIES, {'invalid': ''})
+        self.assertEqual(self.new_client.request_url, url_before)
+
+    def test_request_success(self):
+        '''Does _request() return a parsed response body with the
+        expected keys?
+        '''
+        self.mock_get.return_value = _mock_response(DATA_FIXTURE)
+        result = self.new_client._request('data', SALARIES, {})
+        self.assertIsInstance(result, dict)
+        self.assertEqual(
+            set(result.keys()),
+            {'info', 'datapath', 'success', 'result'})
+
+    def test_request_non_200(self):
+        '''Does _request() warn and return None for a non-200 status?'''
+        self.mock_get.return_value = _mock_response(b'', status_code=500)
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(
+                self.new_client._request('data', SALARIES, {}))
+
+    def test_get_metadata_non_200(self):
+        '''Does get_metadata() warn and return None for a non-200
+        status?
+        '''
+        self.mock_get.return_value = _mock_response(b'', status_code=404)
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(self.new_client.get_metadata(datapath=VISITORS))
+
+    def test_get_metadata_python_data_type(self):
+        '''Does get_metadata() stamp python_type onto every column?'''
+        self.mock_get.return_value = _mock_response(META_FIXTURE)
+        metadata = self.new_client.get_metadata(datapath=VISITORS)
+        for column in metadata['result']['columns']:
+            self.assertIn('python_type', column)
 
     def test_get_limits_datapath_failure(self):
         '''Does get_limits() raise a TypeError when a datapath is passed?'''
         with self.assertRaises(TypeError):
-            self.new_client.get_limits(
-                datapath='us.gov.whitehouse.salaries.2011')
+            self.new_client.get_limits(datapath=SALARIES)
 
-    @mock.patch.object(client.EnigmaAPI, '_request', autospec=True)
+    @mock.patch.object(client.EnigmaAPI, '_fetch', autospec=True)
     def test_get_limits(self, mock_method):
-        '''Does get_limits() call _request with resource='limits'?
+        '''Does get_limits() fetch the URL precomputed in __init__?
         '''
+        mock_method.return_value = b'{}'
         self.new_client.get_limits()
         mock_method.assert_called_with(
-            self.new_client, datapath=None, resource='limits')
+            self.new_client, self.new_client._limits_url)
 
     def test_get_data_no_datapath_failure(self):
         '''Does get_data() raise a TypeError when no datapath is passed?'''
@@ -98,10 +164,19 @@ class TestClient(unittest.TestCase):
     @mock.patch.object(client.EnigmaAPI, '_request', autospec=True)
     def test_get_data(self, mock_method):
         '''Does get_data() call _request with resource='data'?'''
-        self.new_client.get_data(datapath='us.gov.whitehouse.salaries.2011')
-        mock_method.assert_called_with(self.new_client,
-                                       datapath='us.gov.whitehouse.salaries.2011',
-                                       resource='data')
+        self.new_client.get_data(datapath=SALARIES)
+        mock_method.assert_called_with(
+            self.new_client, 'data', SALARIES, {})
+
+    @mock.patch.object(client.EnigmaAPI, 'get_data', autospec=True)
+    def test_iter_data(self, mock_method):
+        '''Does iter_data() yield pages until next_page is empty?'''
+        mock_method.side_effect = [
+            {'info': {'next_page': 2}, 'result': []},
+            {'info': {'next_page': None}, 'result': []}]
+        pages = list(self.new_client.iter_data(datapath=SALARIES))
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(mock_method.call_count, 2)
 
     def test_get_metadata_no_datapath_failure(self):
         '''Does get_metadata() raise a TypeError when no datapath is
@@ -113,10 +188,9 @@ class TestClient(unittest.TestCase):
     @mock.patch.object(client.EnigmaAPI, '_request', autospec=True)
     def test_get_metadata(self, mock_method):
         '''Does get_metadata() call _request with resource='metadata'?'''
-        self.new_client.get_metadata(datapath='us.gov.whitehouse.salaries.2011')
-        mock_method.assert_called_with(self.new_client,
-                                       datapath='us.gov.whitehouse.salaries.2011',
-                                       resource='meta')
+        self.new_client.get_metadata(datapath=SALARIES)
+        mock_method.assert_called_with(
+            self.new_client, 'meta', SALARIES, {})
 
     def test_map_metadata_data_type_python_data_type(self):
         '''Does _map_metadata_data_type() return a dictionary key
@@ -130,6 +204,9 @@ class TestClient(unittest.TestCase):
         '''Does _map_metadata_data_type() return the correct Python
         data type for the type string returned?
         '''
+        # decimal is only needed here, so it isn't paid for at module
+        # import by the rest of the suite.
+        import decimal
         test_col = [{'id': 'test', 'type': 'type_numeric'}]
         self.assertEqual(
             client._map_metadata_data_type(
@@ -152,10 +229,18 @@ class TestClient(unittest.TestCase):
     def test_get_stats(self, mock_method):
         '''Does get_stats() call _request with resource='stats'?
         '''
-        self.new_client.get_stats(datapath='us.gov.whitehouse.salaries.2011')
-        mock_method.assert_called_with(self.new_client,
-                                       datapath='us.gov.whitehouse.salaries.2011',
-                                       resource='stats')
+        self.new_client.get_stats(datapath=SALARIES)
+        mock_method.assert_called_with(
+            self.new_client, 'stats', SALARIES, {})
+
+    @mock.patch.object(client.EnigmaAPI, '_fetch', autospec=True)
+    def test_get_export_url(self, mock_method):
+        '''Does get_export_url() return just the head_url string?'''
+        mock_method.return_value = b'{"head_url": "https://example.com/x.gz"}'
+        self.assertEqual(
+            self.new_client.get_export_url(
+                datapath=SALARIES),
+            'https://example.com/x.gz')
 
     def test_get_export_no_datapath_failure(self):
         '''Does get_export() raise a TypeError when no datapath is passed?'''
@@ -165,7 +250,6 @@ class TestClient(unittest.TestCase):
     @mock.patch.object(client.EnigmaAPI, '_request', autospec=True)
     def test_get_export(self, mock_method):
         '''Does get_export() call _request with resource='export'?'''
-        self.new_client.get_export(datapath='us.gov.whitehouse.salaries.2011')
-        mock_method.assert_called_with(self.new_client,
-                                       datapath='us.gov.whitehouse.salaries.2011',
-                                       resource='export')
+        self.new_client.get_export(datapath=SALARIES)
+        mock_method.assert_called_with(
+            self.new_client, 'export', SALARIES, {})
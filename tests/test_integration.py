@@ -0,0 +1,101 @@
+'''End-to-end tests against the live Enigma API.
+
+These tests exercise real request/response handling rather than mocked
+internals. HTTP traffic is recorded to VCR cassettes under
+``tests/fixtures/cassettes/`` on the first run and replayed from disk
+afterwards, so only the initial (or deliberately re-recorded) run pays
+for network round trips. The API key is scrubbed from recorded
+requests before cassettes touch disk.
+
+The whole module is skipped when ``ENIGMA_API_KEY`` is unset or vcrpy
+is not installed.
+'''
+
+import os
+import unittest
+
+try:
+    import vcr
+except ImportError:
+    vcr = None
+
+# The integration marker lets pytest deselect the network-dependent
+# set with -m 'not integration'; under the stock unittest runner the
+# skipUnless guards below do the same job.
+try:
+    import pytest
+    _integration = pytest.mark.integration
+except ImportError:
+    def _integration(cls):
+        return cls
+
+from pynigma import client
+
+API_KEY = os.environ.get('ENIGMA_API_KEY')
+
+SALARIES = 'us.gov.whitehouse.salaries.2011'
+VISITORS = 'us.gov.whitehouse.visitor-list'
+
+CASSETTE_DIR = os.path.join(
+    os.path.dirname(__file__), 'fixtures', 'cassettes')
+
+
+def _scrub_key(request):
+    if API_KEY:
+        request.uri = request.uri.replace(API_KEY, 'ENIGMA_API_KEY')
+    return request
+
+
+def _cassette(name):
+    if vcr is None:
+        return lambda func: func
+    # The key is scrubbed out of recorded URIs, so replays match on
+    # method only; each cassette holds a single request.
+    return vcr.use_cassette(
+        os.path.join(CASSETTE_DIR, name), record_mode='once',
+        match_on=['method'], before_record_request=_scrub_key)
+
+
+@_integration
+@unittest.skipUnless(vcr, 'vcrpy is not installed')
+@unittest.skipUnless(API_KEY, 'ENIGMA_API_KEY is not set')
+class TestClientIntegration(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.new_client = client.EnigmaAPI(API_KEY)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.new_client.close()
+
+    # Responses shared by several tests are fetched once per run;
+    # identical get_data calls would otherwise each replay (or worse,
+    # record) their own round trip.
+    _data_cache = {}
+
+    @classmethod
+    def _cached_get_data(cls, datapath):
+        if datapath not in cls._data_cache:
+            cls._data_cache[datapath] = cls.new_client.get_data(
+                datapath=datapath)
+        return cls._data_cache[datapath]
+
+    @_cassette('data_success.yaml')
+    def test_request_success(self):
+        '''Does get_data() return a parsed response with the expected
+        top-level keys?
+        '''
+        result = self._cached_get_data(SALARIES)
+        self.assertIsInstance(result, dict)
+        self.assertEqual(
+            set(result.keys()),
+            {'info', 'datapath', 'success', 'result'})
+
+    @_cassette('metadata.yaml')
+    def test_get_metadata_correct_python_data_type(self):
+        '''Does get_metadata() map every column to a Python type?'''
+        metadata = self.new_client.get_metadata(
+            datapath=VISITORS)
+        for column in metadata['result']['columns']:
+            self.assertIsInstance(column['python_type'], type)